@@ -23,133 +23,182 @@ The script:
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
+import orjson
+
+from jarvix.ingest.connectors import iter_json_items
 from jarvix.memory import MemoryManager
 
 
-def extract_vision_memories(data: Dict[str, Any]) -> List[Dict[str, str]]:
+# Memories buffered per batch_add_memories call
+BATCH_SIZE = 128
+
+
+def _build_entry(extraction: Any) -> Dict[str, str] | None:
     """
-    Extract vision memories from JSON data.
+    Build a memory entry from a single extraction.
     
-    Each extraction combines description and text into a single memory.
+    Combines description and text into a single memory.
     
     Args:
-        data: JSON data with extractions array
+        extraction: One item of the extractions array
         
     Returns:
-        List of dicts with 'memory' and metadata
+        Dict with 'memory' and metadata, or None if there is nothing to store
     """
-    memories = []
+    if not isinstance(extraction, dict):
+        return None
+        
+    # Extract content
+    content = extraction.get("content", {})
+    if not isinstance(content, dict):
+        return None
     
-    # Check for extractions array
-    if "extractions" not in data or not isinstance(data["extractions"], list):
-        return memories
+    # Fields are not always strings: `text` can be a list of OCR lines
+    description = content.get("description")
+    description = description.strip() if isinstance(description, str) else ""
+    text = content.get("text")
+    if isinstance(text, list):
+        text = " ".join(s.strip() for s in text if isinstance(s, str) and s.strip())
+    else:
+        text = text.strip() if isinstance(text, str) else ""
     
-    for extraction in data["extractions"]:
-        if not isinstance(extraction, dict):
-            continue
-            
-        # Extract content
-        content = extraction.get("content", {})
-        if not isinstance(content, dict):
-            continue
-        
-        description = content.get("description", "").strip()
-        text = content.get("text", "").strip()
+    # Skip if both are empty
+    if not description and not text:
+        return None
+    
+    # Combine description + text (with space between if both exist)
+    combined_memory = f"{description} {text}" if description and text else (description or text)
+    
+    # Create memory entry with metadata
+    return {
+        "memory": combined_memory,
+        "filename": extraction.get("filename", ""),
+        "date": extraction.get("date", ""),
+    }
+
+
+def iter_vision_memories(json_path: Path) -> Iterator[Dict[str, str]]:
+    """
+    Stream vision memories from a JSON file.
+    
+    Extractions are parsed one at a time with ijson (via the connectors'
+    shared reader), so memory use stays constant regardless of file size.
+    
+    Args:
+        json_path: Path to the JSON file with an extractions array
         
-        # Skip if both are empty
-        if not description and not text:
+    Yields:
+        Dicts with 'memory' and metadata
+    """
+    for extraction in iter_json_items(json_path, "extractions.item"):
+        entry = _build_entry(extraction)
+        if entry is not None:
+            yield entry
+
+
+def _submit_batch(
+    manager: MemoryManager,
+    user_id: str,
+    batch: List[Dict[str, Any]],
+    max_workers: int,
+) -> int:
+    """
+    Send one batch of memories and print a ✓/✗ line per item.
+    
+    Returns:
+        Number of memories ingested successfully
+    """
+    # Adds run concurrently; results come back in input order so the
+    # output below stays ordered
+    results = manager.batch_add_memories(user_id=user_id, items=batch, max_workers=max_workers)
+    
+    ingested_count = 0
+    for item, result in zip(batch, results):
+        idx = item["metadata"]["vision_index"]
+        if isinstance(result, Exception):
+            print(f"   ✗ [{idx}] Failed: {result}")
             continue
+        ingested_count += 1
         
-        # Combine description + text (with space between if both exist)
-        combined_parts = []
-        if description:
-            combined_parts.append(description)
-        if text:
-            combined_parts.append(text)
-        
-        combined_memory = " ".join(combined_parts)
-        
-        # Create memory entry with metadata
-        memory_entry = {
-            "memory": combined_memory,
-            "filename": extraction.get("filename", ""),
-            "date": extraction.get("date", ""),
-        }
-        
-        memories.append(memory_entry)
+        # Show preview of memory (truncated)
+        text = item["text"]
+        preview = text[:80] + "..." if len(text) > 80 else text
+        print(f"   ✓ [{idx}] {preview}")
     
-    return memories
+    return ingested_count
 
 
 def ingest_vision_file(
     json_path: Path,
     manager: MemoryManager,
     metadata: Dict[str, Any] | None = None,
+    max_workers: int = 16,
+    batch_size: int = BATCH_SIZE,
 ) -> None:
     """
     Ingest vision data from a JSON file into mem0.
     
+    Extractions are streamed from the file and sent in batches of
+    `batch_size`, so at most one batch is held in memory at a time.
+    
     Args:
         json_path: Path to the JSON file
         manager: MemoryManager instance
         metadata: Optional metadata to attach to each memory
+        max_workers: Maximum number of concurrent add requests
+        batch_size: Number of memories sent per batch
     """
     # Use filename (without extension) as user_id
     user_id = json_path.stem
     
-    # Read and parse the JSON file
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    
-    # Extract vision memories
-    vision_memories = extract_vision_memories(data)
+    print(f"\n📥 Ingesting vision memories for user: {user_id}")
+    print(f"   Source file: {json_path}")
     
-    if not vision_memories:
-        print(f"⚠️  No vision data found in {json_path}")
-        return
+    # Base metadata shared by every memory (built once; the caller's dict
+    # is left untouched)
+    base_metadata = dict(metadata or {})
+    base_metadata["source_file"] = str(json_path)
+    base_metadata["source_type"] = "vision"
     
-    print(f"\n📥 Ingesting {len(vision_memories)} vision memories for user: {user_id}")
-    print(f"   Source file: {json_path}")
+    ingested_count = 0
+    total = 0
+    batch: List[Dict[str, Any]] = []
+    for idx, mem_data in enumerate(iter_vision_memories(json_path), 1):
+        total = idx
+        
+        # Combine base metadata with memory-specific metadata
+        mem_metadata = base_metadata.copy()
+        mem_metadata["vision_index"] = idx
+        mem_metadata["image_filename"] = mem_data["filename"]
+        mem_metadata["image_date"] = mem_data["date"]
+        batch.append({"text": mem_data["memory"], "metadata": mem_metadata})
+        
+        if len(batch) >= batch_size:
+            ingested_count += _submit_batch(manager, user_id, batch, max_workers)
+            batch.clear()
     
-    # Add default metadata if not provided
-    if metadata is None:
-        metadata = {}
+    if batch:
+        ingested_count += _submit_batch(manager, user_id, batch, max_workers)
     
-    # Add source file to metadata
-    metadata["source_file"] = str(json_path)
-    metadata["source_type"] = "vision"
+    if not total:
+        print(f"⚠️  No vision data found in {json_path}")
+        return
     
-    # Ingest each vision memory
-    ingested_count = 0
-    for idx, mem_data in enumerate(vision_memories, 1):
-        try:
-            # Combine base metadata with memory-specific metadata
-            mem_metadata = {
-                **metadata,
-                "vision_index": idx,
-                "image_filename": mem_data["filename"],
-                "image_date": mem_data["date"],
-            }
-            
-            manager.add_memory(
-                user_id=user_id,
-                text=mem_data["memory"],
-                metadata=mem_metadata
-            )
-            ingested_count += 1
-            
-            # Show preview of memory (truncated)
-            preview = mem_data["memory"][:80] + "..." if len(mem_data["memory"]) > 80 else mem_data["memory"]
-            print(f"   ✓ [{idx}/{len(vision_memories)}] {preview}")
-            
-        except Exception as e:
-            print(f"   ✗ [{idx}/{len(vision_memories)}] Failed: {e}")
-    
-    print(f"\n✅ Successfully ingested {ingested_count}/{len(vision_memories)} vision memories")
+    print(f"\n✅ Successfully ingested {ingested_count}/{total} vision memories")
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be >= 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
 
 
 def main() -> None:
@@ -185,6 +234,12 @@ Examples:
         type=str,
         help="mem0 API key (can also use MEM0_API_KEY env var)",
     )
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=16,
+        help="Maximum number of concurrent add requests (default: 16)",
+    )
     
     args = parser.parse_args()
     
@@ -197,8 +252,8 @@ Examples:
     metadata = None
     if args.metadata:
         try:
-            metadata = json.loads(args.metadata)
-        except json.JSONDecodeError as e:
+            metadata = orjson.loads(args.metadata.encode())
+        except orjson.JSONDecodeError as e:
             print(f"❌ Error: Invalid JSON in --metadata: {e}")
             return
     
@@ -209,7 +264,7 @@ Examples:
         manager = MemoryManager()
     
     # Ingest the file
-    ingest_vision_file(args.json_file, manager, metadata)
+    ingest_vision_file(args.json_file, manager, metadata, max_workers=args.workers)
 
 
 if __name__ == "__main__":
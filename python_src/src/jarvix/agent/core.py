@@ -4,12 +4,14 @@ Core agent implementation with Grok AI and mem0.
 
 from __future__ import annotations
 
-import json
 import os
 import random
-from datetime import datetime, timezone
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional, List
 
+import orjson
 from xai_sdk import Client
 from xai_sdk.chat import system, user, tool_result
 from xai_sdk.tools import web_search, get_tool_call_type
@@ -18,6 +20,71 @@ from jarvix.memory import MemoryManager
 from .tools import MemoryTools, CalendarTools, get_memory_tool_definitions, get_calendar_tool_definitions
 
 
+# Tool-call types that must be executed locally
+_CLIENT_CALL_TYPES = frozenset(("function", "client_side_tool"))
+
+# Flush streamed output to the terminal every this many characters
+_STREAM_FLUSH_CHARS = 64
+
+# Message roles, taken from the SDK's own constructors
+_SYSTEM_ROLE = system("").role
+_USER_ROLE = user("").role
+
+# Client-side tool schemas are static; build them once at import
+_MEM_TOOLS = get_memory_tool_definitions()
+_CAL_TOOLS = get_calendar_tool_definitions()
+
+_DEFAULT_SYSTEM_PROMPT = (
+    "You are Jarvix, Tesla's conversational co-pilot.\n"
+    "\n"
+    "VOICE RULES:\n"
+    "- Max 2-3 short sentences per reply.\n"
+    "- Lead with the action/answer, then one brief detail.\n"
+    "- Use contractions naturally: I'll, you're, let's.\n"
+    "- No bullets, no lists, no markdown.\n"
+    "- Quick acknowledgments: Got it. On it. Done.\n"
+    "\n"
+    "STYLE:\n"
+    "- Short, spoken sentences. No over-explaining.\n"
+    "- Lead with the action, then one brief detail.\n"
+    "- Avoid filler words. Avoid apologies unless truly necessary.\n"
+    "- Never expose internal tool wiring. Do not mention mem0 or tool calls.\n"
+    "- End with one concise clarifying question only if it clearly moves the trip forward (e.g., “Order your usual latte for pickup?”).\n"
+    "\n"
+    "MEMORY:\n"
+    "- Always search memories first to personalize.\n"
+    "- Store new preferences silently—never mention storing.\n"
+    "- If user says 'my usual' or 'like always', recall it confidently.\n"
+    "\n"
+    "PROACTIVE:\n"
+    "- Offer A/B choices, not open-ended: 'Starbucks on the way, or straight to work?'\n"
+    "- If something relevant is imminent, mention it briefly.\n"
+    "\n"
+    "NEVER:\n"
+    "- Apologize for limitations.\n"
+    "- Mention tools, memories, or internal steps.\n"
+    "- Exceed ~30 words unless the user asked for detail."
+)
+
+_FALLBACKS = (
+    "Connection's spotty. What were you saying?",
+    "Didn't catch that. Try again?",
+    "Still here—network hiccup. Go ahead.",
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_utc(ts: str) -> Optional[datetime]:
+    """Parse an ISO timestamp to an aware UTC datetime (naive means UTC)."""
+    try:
+        dt = datetime.fromisoformat(ts)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except Exception:
+        return None
+
+
 class ProactiveAgent:
     """
     Proactive AI agent with web search and persistent memory.
@@ -35,7 +102,8 @@ class ProactiveAgent:
         xai_api_key: Optional[str] = None,
         mem0_api_key: Optional[str] = None,
         model: str = "grok-4-1-fast",
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        max_history: int = 40,
     ):
         """
         Initialize the proactive agent.
@@ -46,9 +114,12 @@ class ProactiveAgent:
             mem0_api_key: mem0 API key (defaults to MEM0_API_KEY env var)
             model: Grok model to use
             system_prompt: Custom system prompt (optional)
+            max_history: Max messages kept in the chat history; older turns
+                         are dropped (the system prompt is always kept)
         """
         self.user_id = user_id
         self.model = model
+        self.max_history = max_history
         
         xai_api_key = xai_api_key or os.getenv("XAI_API_KEY")
         mem0_api_key = mem0_api_key or os.getenv("MEM0_API_KEY")
@@ -68,17 +139,10 @@ class ProactiveAgent:
             "get_all_memories": self.memory_tools.get_all_memories,
             "create_calendar_event": self.calendar_tools.create_event,
         }
-        self._tool_count = 1 + len(get_memory_tool_definitions()) + len(get_calendar_tool_definitions())
+        self._tool_count = 1 + len(_MEM_TOOLS) + len(_CAL_TOOLS)
         
         # Create chat with tools
-        self.chat = self.client.chat.create(
-            model=model,
-            tools=[
-                web_search(),  # Server-side
-                *get_memory_tool_definitions(),  # Client-side
-                *get_calendar_tool_definitions(),
-            ]
-        )
+        self.chat = self._build_chat()
         
         # Set system prompt
         if system_prompt is None:
@@ -86,85 +150,56 @@ class ProactiveAgent:
         
         self.chat.append(system(system_prompt))
     
+    def _build_chat(self):
+        """Create a chat session with the full server- and client-side tool list."""
+        return self.client.chat.create(
+            model=self.model,
+            tools=[
+                web_search(),  # Server-side
+                *_MEM_TOOLS,  # Client-side
+                *_CAL_TOOLS,
+            ]
+        )
+    
     # ------------------- time-aware helpers -------------------
     def _parse_iso(self, ts: Optional[str]) -> Optional[datetime]:
-        if not ts:
-            return None
-        try:
-            dt = datetime.fromisoformat(ts)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
-        except Exception:
+        if not ts or not isinstance(ts, str):
             return None
+        # Memoized: the same memory timestamps are seen on every turn
+        return _parse_iso_utc(ts)
 
     def _upcoming_context(self, window_minutes: int = 60) -> Optional[str]:
         """Return a short context string if there is a memory within the next window."""
         try:
-            memories = MemoryManager().get_memories(user_id=self.user_id)
+            memories = self.memory_tools.cached_memories()
         except Exception:
             return None
 
         now = datetime.now(timezone.utc)
-        soon = now.timestamp() + window_minutes * 60
+        soon = now + timedelta(minutes=window_minutes)
 
-        upcoming: List[str] = []
+        # Keep it concise: the first memory inside the window wins
         for mem in memories:
             meta = mem.get("metadata", {}) or {}
             ts = meta.get("timestamp") or meta.get("start_utc")
             dt = self._parse_iso(ts)
             if not dt:
                 continue
-            if now <= dt <= datetime.fromtimestamp(soon, tz=timezone.utc):
+            if now <= dt <= soon:
                 # Build a short label from memory text and time
                 label = mem.get("memory") or mem.get("text") or ""
                 dt_str = dt.strftime("%H:%M UTC")
                 if label:
-                    upcoming.append(f"{dt_str} | {label[:80]}")
-                else:
-                    upcoming.append(f"{dt_str}")
-
-        if not upcoming:
-            return None
+                    return f"Upcoming within {window_minutes}m: {dt_str} | {label[:80]}"
+                return f"Upcoming within {window_minutes}m: {dt_str}"
 
-        # Keep it concise: include only the first item
-        return f"Upcoming within {window_minutes}m: {upcoming[0]}"
+        return None
     
     def _default_system_prompt(self) -> str:
         """
         Voice-first, concise Jarvix brand voice.
         """
-        return (
-            "You are Jarvix, Tesla's conversational co-pilot.\n"
-            "\n"
-            "VOICE RULES:\n"
-            "- Max 2-3 short sentences per reply.\n"
-            "- Lead with the action/answer, then one brief detail.\n"
-            "- Use contractions naturally: I'll, you're, let's.\n"
-            "- No bullets, no lists, no markdown.\n"
-            "- Quick acknowledgments: Got it. On it. Done.\n"
-            "\n"
-            "STYLE:\n"
-            "- Short, spoken sentences. No over-explaining.\n"
-            "- Lead with the action, then one brief detail.\n"
-            "- Avoid filler words. Avoid apologies unless truly necessary.\n"
-            "- Never expose internal tool wiring. Do not mention mem0 or tool calls.\n"
-            "- End with one concise clarifying question only if it clearly moves the trip forward (e.g., “Order your usual latte for pickup?”).\n"
-            "\n"
-            "MEMORY:\n"
-            "- Always search memories first to personalize.\n"
-            "- Store new preferences silently—never mention storing.\n"
-            "- If user says 'my usual' or 'like always', recall it confidently.\n"
-            "\n"
-            "PROACTIVE:\n"
-            "- Offer A/B choices, not open-ended: 'Starbucks on the way, or straight to work?'\n"
-            "- If something relevant is imminent, mention it briefly.\n"
-            "\n"
-            "NEVER:\n"
-            "- Apologize for limitations.\n"
-            "- Mention tools, memories, or internal steps.\n"
-            "- Exceed ~30 words unless the user asked for detail."
-        )
+        return _DEFAULT_SYSTEM_PROMPT
     
     def _get_time_context(self) -> Optional[str]:
         """Build minimal time-aware context for the model."""
@@ -205,12 +240,7 @@ class ProactiveAgent:
 
     def _fallback_message(self) -> str:
         """Return a varied, context-free fallback."""
-        options = [
-            "Connection's spotty. What were you saying?",
-            "Didn't catch that. Try again?",
-            "Still here—network hiccup. Go ahead.",
-        ]
-        return random.choice(options)
+        return random.choice(_FALLBACKS)
 
     def chat_message(self, message: Optional[str], trigger: str, verbose: bool = True) -> str:
         """
@@ -250,7 +280,9 @@ class ProactiveAgent:
                 streamed_content = ""
                 final_response = None
 
-                # Stream to show incremental output
+                # Stream to show incremental output; flush in batches rather
+                # than issuing a write syscall per chunk
+                unflushed = 0
                 for response, chunk in self.chat.stream():
                     final_response = response
                     if chunk.tool_calls and verbose:
@@ -259,7 +291,13 @@ class ProactiveAgent:
                     if chunk.content:
                         streamed_content += chunk.content
                         if verbose:
-                            print(chunk.content, end="", flush=True)
+                            sys.stdout.write(chunk.content)
+                            unflushed += len(chunk.content)
+                            if unflushed >= _STREAM_FLUSH_CHARS:
+                                sys.stdout.flush()
+                                unflushed = 0
+                if unflushed:
+                    sys.stdout.flush()
 
                 # Append assistant message (with tool calls) to history if present
                 if final_response and hasattr(final_response, "message"):
@@ -277,16 +315,17 @@ class ProactiveAgent:
                     call_type = get_tool_call_type(tool_call)
                     if verbose:
                         print(f"[dbg] Tool call type: {call_type}")
-                    if call_type in ["function", "client_side_tool"]:
+                    if call_type in _CLIENT_CALL_TYPES:
                         func_name = tool_call.function.name
-                        func_args = json.loads(tool_call.function.arguments)
+                        func_args = orjson.loads(tool_call.function.arguments)
                         if verbose:
                             print(f"[dbg] executing client tool {func_name} with args={func_args}")
-                        if func_name in self.client_tools_map:
-                            result = self.client_tools_map[func_name](**func_args)
+                        handler = self.client_tools_map.get(func_name)
+                        if handler is not None:
+                            result = handler(**func_args)
                             if not isinstance(result, str):
                                 try:
-                                    result_text = json.dumps(result)
+                                    result_text = orjson.dumps(result).decode()
                                 except Exception:
                                     result_text = str(result)
                             else:
@@ -310,6 +349,8 @@ class ProactiveAgent:
                 print(f"\n{err}")
             return err
 
+        self._trim_history()
+
         if verbose:
             print()
 
@@ -321,6 +362,35 @@ class ProactiveAgent:
             print(fallback)
         return fallback
     
+    def _trim_history(self) -> None:
+        """
+        Drop the oldest turns once the history exceeds `max_history`.
+
+        The system prompt is always kept, and the cut lands on a user
+        message (plus its preceding context note) so assistant tool calls
+        are never separated from their tool results. If a turn's context
+        note would not fit under the limit, the cut moves on to the next
+        turn instead.
+        """
+        messages = self.chat.messages
+        if len(messages) <= self.max_history:
+            return
+
+        # Earliest index that can be kept alongside the system prompt
+        limit = len(messages) - (self.max_history - 1)
+        cut = limit
+        while cut < len(messages):
+            if messages[cut].role == _USER_ROLE:
+                if messages[cut - 1].role != _SYSTEM_ROLE:
+                    break
+                if cut - 1 >= limit:
+                    cut -= 1
+                    break
+            cut += 1
+        if cut >= len(messages):
+            return
+        del messages[1:cut]
+    
     def get_conversation_history(self) -> list[Dict[str, Any]]:
         """
         Get the conversation history.
@@ -334,13 +404,7 @@ class ProactiveAgent:
         """Reset the conversation while keeping the system prompt."""
         system_msg = self.chat.messages[0] if self.chat.messages else None
         
-        self.chat = self.client.chat.create(
-            model=self.model,
-            tools=[
-                web_search(),
-                *get_memory_tool_definitions()
-            ]
-        )
+        self.chat = self._build_chat()
         
         if system_msg:
             self.chat.messages.append(system_msg)
@@ -4,13 +4,50 @@ Agent tools for mem0 memory integration.
 
 from __future__ import annotations
 
-import difflib
-from typing import Any, Dict, List, Tuple
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from itertools import islice
+from typing import Any, Dict, List, Optional, Tuple
 
 from jarvix.memory import MemoryManager
 from jarvix.integrations import google_calendar
 
 
+_WORD_RE = re.compile(r"\w+")
+_EMPTY: Dict[str, Any] = {}
+# Minimum TF-IDF cosine for a search hit. On sample memories, real matches
+# ("flight seat", "lattes", "peanut allergy") score >= 0.2 while n-gram noise
+# stays under 0.05.
+_MIN_SCORE = 0.15
+
+# (idf weights, per-memory TF-IDF vectors, lowercased memory texts)
+_SearchIndex = Tuple[Dict[str, float], List[Dict[str, float]], List[str]]
+
+
+def _terms(text: str) -> List[str]:
+    """
+    Lowercased words, adjacent-word bigrams, and 3-5 character n-grams
+    within each space-padded word (sklearn's `analyzer="char_wb"`), so
+    "flight" still matches "flights" and "lattes" matches "latte".
+    """
+    words = _WORD_RE.findall(text.lower())
+    terms = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    for word in words:
+        padded = f" {word} "
+        for n in range(3, 6):
+            terms.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return terms
+
+
+def _normalize(weights: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    if not norm:
+        return weights
+    return {t: w / norm for t, w in weights.items()}
+
+
 class MemoryTools:
     """
     Client-side mem0 memory tools.
@@ -28,6 +65,19 @@ class MemoryTools:
         """
         self.user_id = user_id
         self.memory = memory_manager
+        # TF-IDF index over the cached memories, rebuilt when the set changes
+        self._index_key: Optional[Tuple[Any, ...]] = None
+        self._index: _SearchIndex = ({}, [], [])
+    
+    def cached_memories(self) -> List[Dict[str, Any]]:
+        """
+        Return the user's memories from the MemoryManager's per-user cache.
+        
+        A single agent turn can read memories several times (time context,
+        search_memories, get_all_memories); the cache (and its staleness
+        bound, `cache_ttl`) keeps that to one round-trip.
+        """
+        return self.memory.get_memories(user_id=self.user_id)
     
     def add_memory(self, memory_text: str, metadata: Dict[str, Any] = None) -> str:
         """
@@ -52,6 +102,7 @@ class MemoryTools:
             text=memory_text,
             metadata=metadata
         )
+        self._index_key = None
         
         # Extract memories from result
         if isinstance(result, dict) and "results" in result:
@@ -61,26 +112,52 @@ class MemoryTools:
         
         return f"Stored memory: {memory_text[:50]}..."
     
-    def _rank_memories(self, query: str, memories: List[Dict[str, Any]]) -> List[Tuple[float, Dict[str, Any]]]:
+    def _build_index(self, memories: List[Dict[str, Any]]) -> _SearchIndex:
         """
-        Rank memories by simple semantic closeness using difflib.
-        Keeps implementation lightweight while improving over raw keyword search.
+        Build (or reuse) the TF-IDF index for the given memory set.
         """
-        query_lower = query.lower()
-        ranked: List[Tuple[float, Dict[str, Any]]] = []
+        # Text is part of the key: mem0 can update a memory in place
+        key = tuple((mem.get("id"), mem.get("memory")) for mem in memories)
+        if key == self._index_key:
+            return self._index
 
-        for mem in memories:
-            text = mem.get("memory", "") or ""
-            ratio = difflib.SequenceMatcher(None, query_lower, text.lower()).ratio()
+        lowered = [(mem.get("memory", "") or "").lower() for mem in memories]
+        docs = [Counter(_terms(text)) for text in lowered]
+        df: Counter = Counter()
+        for doc in docs:
+            df.update(doc.keys())
 
-            # Light keyword boost
-            if query_lower in text.lower():
-                ratio += 0.15
+        # Smoothed idf, as in sklearn's TfidfVectorizer
+        n = len(docs)
+        idf = {t: math.log((1 + n) / (1 + c)) + 1.0 for t, c in df.items()}
+        doc_vecs = [_normalize({t: tf * idf[t] for t, tf in doc.items()}) for doc in docs]
+        self._index = (idf, doc_vecs, lowered)
+        self._index_key = key
+        return self._index
 
-            ranked.append((ratio, mem))
+    @staticmethod
+    def _rank_memories(
+        query: str,
+        memories: List[Dict[str, Any]],
+        index: _SearchIndex,
+        k: int = 5,
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Return the top-k memories by TF-IDF cosine similarity to the query.
+        `index` is `_build_index(memories)`; document vectors are cached
+        across calls, so each search only costs one sparse dot product per
+        memory.
+        """
+        idf, doc_vecs, _ = index
+        q = _normalize({t: idf[t] for t in set(_terms(query)) if t in idf})
+        if not q:
+            return []
 
-        ranked.sort(key=lambda x: x[0], reverse=True)
-        return ranked
+        scored = (
+            (sum(w * vec.get(t, 0.0) for t, w in q.items()), mem)
+            for vec, mem in zip(doc_vecs, memories)
+        )
+        return heapq.nlargest(k, scored, key=lambda x: x[0])
 
     def search_memories(self, query: str) -> str:
         """
@@ -93,13 +170,26 @@ class MemoryTools:
             Formatted string of relevant memories
         """
         # Get all memories
-        memories = self.memory.get_memories(user_id=self.user_id)
+        memories = self.cached_memories()
         
         if not memories:
             return "No memories found."
         
-        ranked = self._rank_memories(query, memories)
-        top = [mem for score, mem in ranked[:5] if score > 0.2]
+        # Literal hits (e.g. "my usual") come first; TF-IDF fills the rest
+        index = self._build_index(memories)
+        query_lower = query.lower().strip()
+        exact = (
+            mem for mem, text in zip(memories, index[2])
+            if query_lower and query_lower in text
+        )
+        top = list(islice(exact, 5))
+        if len(top) < 5:
+            seen = {id(mem) for mem in top}
+            for score, mem in self._rank_memories(query, memories, index, k=5 + len(top)):
+                if score > _MIN_SCORE and id(mem) not in seen:
+                    top.append(mem)
+                    if len(top) == 5:
+                        break
 
         if not top:
             return f"No memories matching '{query}'"
@@ -117,25 +207,22 @@ class MemoryTools:
         Returns:
             Formatted string of all memories
         """
-        memories = self.memory.get_memories(user_id=self.user_id)
+        memories = self.cached_memories()
         
         if not memories:
             return "No memories stored yet."
         
         # Group by category if available
-        categorized = {}
+        categorized: Dict[str, List[Any]] = defaultdict(list)
         for mem in memories:
-            category = mem.get("metadata", {}).get("category", "general")
-            if category not in categorized:
-                categorized[category] = []
+            category = (mem.get("metadata") or _EMPTY).get("category", "general")
             categorized[category].append(mem.get("memory"))
         
         # Format output
         results = [f"Total: {len(memories)} memories\n"]
         for category, mems in categorized.items():
             results.append(f"{category.upper()}:")
-            for mem in mems[:3]:
-                results.append(f"  • {mem}")
+            results.extend(f"  • {mem}" for mem in mems[:3])
         
         return "\n".join(results)
 
@@ -1,6 +1,6 @@
 # Connector loaders for ingestion.
 
+from jarvix.ingest.connectors._stream import iter_json_items
 from jarvix.ingest.connectors import calendar, vision, audio
 
-__all__ = ["calendar", "vision", "audio"]
-
+__all__ = ["calendar", "vision", "audio", "iter_json_items"]
@@ -0,0 +1,18 @@
+# Streaming JSON reader shared by the connector loaders.
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator
+
+import ijson
+
+
+def iter_json_items(path: Path, prefix: str) -> Iterator[Any]:
+    """
+    Stream the items of a top-level JSON array (e.g. "extractions.item")
+    one at a time, without loading the whole file.
+    """
+    with Path(path).open("rb") as f:
+        # use_float keeps numbers JSON-serializable (no Decimal)
+        yield from ijson.items(f, prefix, use_float=True)
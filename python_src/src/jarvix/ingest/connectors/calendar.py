@@ -1,19 +1,38 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, Tuple
 
+from jarvix.ingest.connectors._stream import iter_json_items
 
+try:  # C ISO-8601 parser, much faster than datetime.fromisoformat
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+else:
+    def _parse_datetime(dt_str: str) -> datetime:
+        try:
+            return _ciso_parse_datetime(dt_str)
+        except ValueError:
+            # ciso8601 rejects some forms fromisoformat accepts (e.g. ordinal
+            # or week dates); fall back so output does not depend on it
+            return datetime.fromisoformat(dt_str)
+
+_UTC = timezone.utc
+
+
+@lru_cache(maxsize=8192)
 def _to_utc(dt_str: str) -> str:
     """
     Convert ISO8601 with offset to UTC ISO string. If parse fails, return the input.
+    Memoized: recurring events repeat the same timestamps.
     """
     try:
-        dt = datetime.fromisoformat(dt_str)
+        dt = _parse_datetime(dt_str)
         if dt.tzinfo:
-            return dt.astimezone(timezone.utc).isoformat()
+            return dt.astimezone(_UTC).isoformat()
     except Exception:
         return dt_str
     return dt_str
@@ -23,11 +42,9 @@ def load_calendar_file(path: Path) -> Iterable[Tuple[Dict[str, object], Dict[str
     """
     Yield (record, metadata) for each calendar event.
     """
-    data = json.loads(path.read_text())
     user_id = Path(path).stem
-    events = data.get("events", [])
 
-    for idx, ev in enumerate(events):
+    for idx, ev in enumerate(iter_json_items(path, "events.item")):
         start = ev.get("start", {})
         end = ev.get("end", {})
         start_dt = start.get("dateTime") or start.get("date")
@@ -1,19 +1,18 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict, Iterable, Tuple
 
+from jarvix.ingest.connectors._stream import iter_json_items
+
 
 def load_vision_file(path: Path) -> Iterable[Tuple[Dict[str, object], Dict[str, object]]]:
     """
     Yield (record, metadata) for each vision extraction.
     """
-    data = json.loads(path.read_text())
     user_id = Path(path).stem
-    extractions = data.get("extractions", [])
 
-    for idx, ex in enumerate(extractions):
+    for idx, ex in enumerate(iter_json_items(path, "extractions.item")):
         content = ex.get("content", {})
         record = {
             "description": content.get("description"),
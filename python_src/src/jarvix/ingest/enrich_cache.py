@@ -0,0 +1,101 @@
+# Persistent cache of Grok enrichment outputs, keyed by record content.
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+class EnrichCache:
+    """
+    Map everything Grok is prompted with (model, system prompt, context
+    note, record, reference memories) to the sentence it produced, so
+    re-ingesting the same data does not pay for the same LLM call. Editing
+    the prompt or a change in the user's memories yields new keys, so stale
+    sentences are not reused.
+
+    Keys are BLAKE2b hashes (fast; no cryptographic role here) of that
+    canonical JSON, so only exact duplicates hit. Near-duplicate
+    (embedding) matching is deliberately not used: calendar records that
+    differ only in start/end time would share an output with the wrong
+    time in it.
+
+    - If `path` is given, entries are loaded from it and `save()` writes
+      them back; otherwise the cache lives only in memory.
+    - Entries are read and written only through `get_or_compute`, which is
+      thread-safe and single-flight: concurrent callers with the same key
+      wait on the first caller's result instead of each calling Grok.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path).expanduser() if path is not None else None
+        self._lock = threading.Lock()
+        self._entries: Dict[str, str] = {}
+        self._inflight: Dict[str, Future] = {}
+        if self.path is not None and self.path.exists():
+            self._entries = json.loads(self.path.read_bytes())
+
+    @staticmethod
+    def key(
+        model: str,
+        system_prompt: str,
+        note: str,
+        record: Dict[str, object],
+        prior_mems: Optional[List[str]] = None,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "model": model,
+                "system": system_prompt,
+                "note": note,
+                "record": record,
+                "reference_memories": prior_mems or [],
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        """
+        Return the cached value for `key`, computing it with `compute()` if
+        missing. Only one caller computes a given key; others block on its
+        result (and see its exception if it fails).
+        """
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._inflight[key] = Future()
+        if not owner:
+            return fut.result()
+
+        try:
+            value = compute()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            fut.set_exception(exc)
+            raise
+        with self._lock:
+            self._entries[key] = value
+            del self._inflight[key]
+        fut.set_result(value)
+        return value
+
+    def save(self) -> None:
+        """Write entries to `path` (no-op for in-memory caches)."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = json.dumps(self._entries, ensure_ascii=False)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(data, encoding="utf-8")
+        tmp.replace(self.path)
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import heapq
 import json
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional, Tuple
@@ -10,6 +14,27 @@ from xai_sdk.chat import system, user
 
 from jarvix.memory import MemoryManager
 from jarvix.ingest import connectors
+from jarvix.ingest.enrich_cache import EnrichCache
+
+# Punctuation treated as word separators when tokenizing for context matching
+_PUNCT_TABLE = str.maketrans({c: " " for c in ",.;:!?()[]{}\"'"})
+
+# Record fields that carry the main text, in priority order
+_TEXT_KEYS = ("transcription", "description", "text", "summary")
+
+_SYSTEM_PROMPT_ENRICH = (
+    "You are a life co-pilot that extracts a single, user-relevant fact for memory. "
+    "Output ONE short factual sentence using only the provided fields. Prioritize user preferences, requests, "
+    "important statements, relationships, career/school, travel/plans, or commitments. Keep it concise and actionable. "
+    "Do not add or infer anything not present. If nothing clearly useful to the user is present, return an empty string. "
+    "No lists or tables. If reference memories are provided, use them only when they explicitly support the fact; otherwise ignore them."
+)
+
+# (memory texts, token -> indices of memories containing it)
+_MemoryIndex = Tuple[List[str], Dict[str, List[int]]]
+
+# (record #, record, metadata, user_id, prior memories) awaiting enrichment
+_Pending = Tuple[int, Dict[str, object], Dict[str, object], str, List[str]]
 
 
 @dataclass
@@ -21,63 +46,74 @@ class IngestConfig:
     user_id: str = "demo_user"
     verbose: bool = False
     enrich: bool = True
+    workers: int = 8  # concurrent Grok enrichment calls per file
+    cache_path: Optional[str] = None  # persist enrichment outputs across runs
+
+
+def _tokenize(val: object) -> List[str]:
+    out: List[str] = []
+    if isinstance(val, list):
+        for v in val:
+            out.extend(_tokenize(v))
+    elif isinstance(val, str):
+        out.extend(w for w in val.lower().translate(_PUNCT_TABLE).split() if len(w) >= 3)
+    return out
+
+
+def _build_memory_index(memories: List[Dict[str, object]]) -> _MemoryIndex:
+    """
+    Tokenize prior memories once into (texts, postings), where postings maps
+    each token to the indices of the memories containing it.
+    """
+    texts: List[str] = []
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for idx, mem in enumerate(memories):
+        text = mem.get("memory") or mem.get("text") or ""
+        texts.append(text)
+        for tok in set(_tokenize(text)):
+            postings[tok].append(idx)
+    return texts, dict(postings)
 
 
 def _select_context_mems(
     record: Dict[str, object],
-    memories: List[Dict[str, object]],
+    index: _MemoryIndex,
     max_items: int = 3,
 ) -> List[str]:
     """
     Pick a few prior memories to give Grok minimal context based on simple token overlap.
+    `index` is the output of `_build_memory_index`; only memories sharing a
+    token with the record are ever touched.
     """
-    def tokenize(val: object) -> List[str]:
-        out: List[str] = []
-        if isinstance(val, list):
-            for v in val:
-                out.extend(tokenize(v))
-        elif isinstance(val, str):
-            for w in val.lower().replace(",", " ").replace(".", " ").split():
-                if len(w) >= 3:
-                    out.append(w)
-        return out
-
-    record_tokens = set()
-    for key in ("transcription", "description", "text", "summary"):
-        record_tokens.update(tokenize(record.get(key)))
-
-    scored: List[Tuple[int, str]] = []
-    for mem in memories:
-        text = mem.get("memory") or mem.get("text") or ""
-        tokens = set(tokenize(text))
-        score = len(record_tokens.intersection(tokens))
-        if score > 0:
-            scored.append((score, text))
+    texts, postings = index
+    record_tokens = {
+        tok
+        for key in _TEXT_KEYS
+        for tok in _tokenize(record.get(key))
+    }
+
+    scored: Counter[int] = Counter()
+    for tok in record_tokens:
+        scored.update(postings.get(tok, ()))
 
-    scored.sort(key=lambda t: t[0], reverse=True)
-    return [t[1] for t in scored[:max_items]]
+    # Highest overlap first; ties keep memory order
+    top = heapq.nsmallest(max_items, scored.items(), key=lambda kv: (-kv[1], kv[0]))
+    return [texts[idx] for idx, _ in top]
 
 
 def _record_to_plain_text(record: Dict[str, object]) -> str:
     """
     Pick a reasonable raw text from the record without Grok enrichment.
+    Returns "" (record is skipped) when no field holds non-empty text.
     """
-    candidates = [
-        record.get("transcription"),
-        record.get("description"),
-        record.get("text"),
-        record.get("summary"),
-    ]
-    for cand in candidates:
-        if isinstance(cand, str) and cand.strip():
-            return cand.strip()
+    for key in _TEXT_KEYS:
+        val = record.get(key)
+        if isinstance(val, str) and (text := val.strip()):
+            return text
     for val in record.values():
-        if isinstance(val, str) and val.strip():
-            return val.strip()
-    try:
-        return json.dumps(record, ensure_ascii=False)
-    except Exception:
-        return ""
+        if isinstance(val, str) and (text := val.strip()):
+            return text
+    return ""
 
 
 def grok_enrich(
@@ -90,15 +126,8 @@ def grok_enrich(
     """
     Use Grok to produce one short, factual sentence from the record.
     """
-    sys_prompt = (
-        "You are a life co-pilot that extracts a single, user-relevant fact for memory. "
-        "Output ONE short factual sentence using only the provided fields. Prioritize user preferences, requests, "
-        "important statements, relationships, career/school, travel/plans, or commitments. Keep it concise and actionable. "
-        "Do not add or infer anything not present. If nothing clearly useful to the user is present, return an empty string. "
-        "No lists or tables. If reference memories are provided, use them only when they explicitly support the fact; otherwise ignore them."
-    )
     chat = client.chat.create(model=model, tools=[])
-    chat.append(system(sys_prompt))
+    chat.append(system(_SYSTEM_PROMPT_ENRICH))
     chat.append(
         user(
             json.dumps(
@@ -130,9 +159,19 @@ def ingest_file(
     path: Path,
     mem: MemoryManager,
     cfg: IngestConfig,
+    cache: Optional[EnrichCache] = None,
+    client: Optional[Client] = None,
+    stop: Optional[threading.Event] = None,
 ) -> Tuple[int, int]:
     """
     Ingest a single data file for the given connector.
+    Identical records are enriched once: pass a shared `cache` to dedup
+    across files, otherwise one is opened for this file (from
+    `cfg.cache_path` if set, else in-memory).
+    Pass a shared `client` to reuse its connection across files; otherwise
+    one is created.
+    If `stop` is set, ingestion ends before the next record is read or
+    stored, including the rest of a batch that is mid-flush.
     Returns: (processed, stored)
     """
     loader: Callable[[Path], Iterable[Tuple[Dict[str, object], Dict[str, object]]]] = {
@@ -141,80 +180,114 @@ def ingest_file(
         "audio": connectors.audio.load_audio_file,
     }[connector]
 
-    client = Client(timeout=cfg.timeout)
+    owns_cache = cache is None
+    if owns_cache:
+        cache = EnrichCache(Path(cfg.cache_path) if cfg.cache_path else None)
+
+    if client is None:
+        client = Client(timeout=cfg.timeout)
     processed = 0
     stored = 0
-    occurrence_counts: Dict[str, int] = {}
-    memories_cache: Optional[List[Dict[str, object]]] = None
-
-    if cfg.verbose:
-        print(f"[{connector}] Starting {path.name}")
-
-    for record, metadata in _iter_limited(loader(path), cfg.limit):
-        processed += 1
-
-        user_id = cfg.user_id or metadata.get("user_id") or "demo_user"
-        metadata["user_id"] = user_id
-        if memories_cache is None:
-            try:
-                memories_cache = mem.get_memories(user_id=user_id)
-            except Exception:
-                memories_cache = []
-
-        prior_mems = _select_context_mems(record, memories_cache or [])
-
-        if cfg.enrich:
-            # Connector-specific context note
-            note = "Connector: {c}. Keep it factual and concise.".format(c=connector)
-            if connector == "calendar":
-                note = (
-                    "Connector: calendar. Include start_utc and end_utc if present, keep it to one short factual sentence."
-                )
+    occurrence_counts: Counter[str] = Counter()
+    memories_cache: Optional[_MemoryIndex] = None
+
+    # Connector-specific context note
+    note = "Connector: {c}. Keep it factual and concise.".format(c=connector)
+    if connector == "calendar":
+        note = (
+            "Connector: calendar. Include start_utc and end_utc if present, keep it to one short factual sentence."
+        )
 
-            text = grok_enrich(
+    def enrich(item: _Pending) -> str:
+        _, record, _, _, prior_mems = item
+        # Single-flight: identical records in this batch (or in files being
+        # ingested concurrently) wait on one Grok call rather than racing
+        return cache.get_or_compute(
+            EnrichCache.key(cfg.model, _SYSTEM_PROMPT_ENRICH, note, record, prior_mems),
+            lambda: grok_enrich(
                 client,
                 cfg.model,
                 record,
                 context_note=note,
                 prior_mems=prior_mems,
-            )
-            if not text:
-                if cfg.verbose:
-                    print(f"[{connector}] {path.name} #{processed}: no enrichment output, skipped")
-                continue
+            ),
+        )
+
+    def flush(batch: List[_Pending]) -> None:
+        nonlocal stored
+        if cfg.enrich:
+            # Each Grok call is a network round-trip; issue the batch concurrently
+            texts = list(pool.map(enrich, batch))
         else:
-            text = _record_to_plain_text(record)
+            texts = [_record_to_plain_text(item[1]) for item in batch]
+
+        # Store in record order so occurrence counts and logs stay deterministic
+        for (num, _, metadata, user_id, _), text in zip(batch, texts):
+            if stop is not None and stop.is_set():
+                return
             if not text:
                 if cfg.verbose:
-                    print(f"[{connector}] {path.name} #{processed}: no raw text found, skipped")
+                    reason = "no enrichment output" if cfg.enrich else "no raw text found"
+                    print(f"[{connector}] {path.name} #{num}: {reason}, skipped")
                 continue
-            if cfg.verbose:
-                print(f"[{connector}] {path.name} #{processed}: using raw text")
-
-        # Track simple occurrence count within this ingest run to boost confidence
-        occurrence_counts[text] = occurrence_counts.get(text, 0) + 1
-        metadata["occurrence_count"] = occurrence_counts[text]
-
-        if cfg.dry_run:
-            print(f"[dry-run] {connector} -> {metadata['source']} | {text}")
-            continue
-
-        mem.add_memory(
-            user_id=user_id,
-            text=text,
-            metadata={
-                "connector": connector,
-                "source": metadata["source"],
-                "record_id": metadata.get("record_id"),
-                "timestamp": metadata.get("timestamp"),
-            },
-            infer=False,  # Store verbatim - text is already enriched by Grok or raw
-        )
-        stored += 1
-        if cfg.verbose:
-            print(
-                f"[{connector}] {path.name} #{processed}: stored (occurrence={metadata['occurrence_count']})"
+            if not cfg.enrich and cfg.verbose:
+                print(f"[{connector}] {path.name} #{num}: using raw text")
+
+            # Track simple occurrence count within this ingest run to boost confidence
+            occurrence_counts[text] += 1
+            metadata["occurrence_count"] = occurrence_counts[text]
+
+            if cfg.dry_run:
+                print(f"[dry-run] {connector} -> {metadata['source']} | {text}")
+                continue
+
+            mem.add_memory(
+                user_id=user_id,
+                text=text,
+                metadata={
+                    "connector": connector,
+                    "source": metadata["source"],
+                    "record_id": metadata.get("record_id"),
+                    "timestamp": metadata.get("timestamp"),
+                },
+                infer=False,  # Store verbatim - text is already enriched by Grok or raw
             )
+            stored += 1
+            if cfg.verbose:
+                print(
+                    f"[{connector}] {path.name} #{num}: stored (occurrence={metadata['occurrence_count']})"
+                )
+
+    if cfg.verbose:
+        print(f"[{connector}] Starting {path.name}")
+
+    batch: List[_Pending] = []
+    with ThreadPoolExecutor(max_workers=max(1, cfg.workers)) as pool:
+        for record, metadata in _iter_limited(loader(path), cfg.limit):
+            if stop is not None and stop.is_set():
+                batch = []
+                break
+            processed += 1
+
+            user_id = cfg.user_id or metadata.get("user_id") or "demo_user"
+            metadata["user_id"] = user_id
+            if memories_cache is None:
+                try:
+                    memories_cache = _build_memory_index(mem.get_memories(user_id=user_id))
+                except Exception:
+                    memories_cache = _build_memory_index([])
+
+            prior_mems = _select_context_mems(record, memories_cache)
+            batch.append((processed, record, metadata, user_id, prior_mems))
+            if len(batch) >= cfg.workers:
+                flush(batch)
+                batch = []
+
+        if batch:
+            flush(batch)
+
+    if owns_cache:
+        cache.save()
 
     return processed, stored
 
@@ -227,13 +300,38 @@ def ingest_paths(
 ) -> Tuple[int, int]:
     total_processed = 0
     total_stored = 0
-    for p in paths:
+    if not paths:
+        return total_processed, total_stored
+
+    # One cache for the whole run so duplicates across files are also skipped
+    cache = EnrichCache(Path(cfg.cache_path) if cfg.cache_path else None)
+    # One client (and connection pool) shared by every file
+    client = Client(timeout=cfg.timeout)
+    stop = threading.Event()
+
+    def run(p: Path) -> Tuple[int, int]:
         if cfg.verbose:
             print(f"[{connector}] Ingesting file: {p}")
-        proc, st = ingest_file(connector, p, mem, cfg)
-        total_processed += proc
-        total_stored += st
-        if cfg.verbose:
-            print(f"[{connector}] {p.name} done: processed={proc}, stored={st}")
+        return ingest_file(connector, p, mem, cfg, cache=cache, client=client, stop=stop)
+
+    try:
+        # Files are independent and network-bound, so ingest them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            futures = {pool.submit(run, p): p for p in paths}
+            try:
+                for fut in as_completed(futures):
+                    proc, st = fut.result()
+                    total_processed += proc
+                    total_stored += st
+                    if cfg.verbose:
+                        print(f"[{connector}] {futures[fut].name} done: processed={proc}, stored={st}")
+            except BaseException:
+                # Stop at the first failing file: drop files not yet started
+                # and have running ones stop before their next record
+                stop.set()
+                pool.shutdown(cancel_futures=True)
+                raise
+    finally:
+        cache.save()
     return total_processed, total_stored
 
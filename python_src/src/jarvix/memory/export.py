@@ -4,12 +4,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import shutil
+import zipfile
 
 
 def export_sqlite_folder(
     source_dir: Optional[str] = None,
     output_dir: Optional[str] = None,
+    compression: int = zipfile.ZIP_STORED,
 ) -> Path:
     """
     Create a ZIP archive of a folder that holds mem0's SQLite data.
@@ -22,6 +23,9 @@ def export_sqlite_folder(
       that it exists.
     - If `output_dir` is None, the archive is created in the current
       working directory.
+    - Files are stored uncompressed by default (`zipfile.ZIP_STORED`):
+      SQLite pages compress poorly, and deflating multi-GB databases is
+      CPU-bound. Pass e.g. `zipfile.ZIP_DEFLATED` to trade speed for size.
 
     Returns the path to the created ZIP file.
     """
@@ -49,11 +53,13 @@ def export_sqlite_folder(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     base_name = out_dir / f"mem0_sqlite_backup_{timestamp}"
 
-    archive_path_str = shutil.make_archive(
-        base_name=str(base_name),
-        format="zip",
-        root_dir=str(src_path),
-    )
+    archive_path = Path(f"{base_name}.zip")
 
-    return Path(archive_path_str)
+    with zipfile.ZipFile(archive_path, "w", compression=compression, allowZip64=True) as zf:
+        for path in sorted(src_path.rglob("*")):
+            if path == archive_path:
+                continue
+            zf.write(path, path.relative_to(src_path))
+
+    return archive_path
 
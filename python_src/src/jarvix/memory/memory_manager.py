@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from mem0 import MemoryClient  # type: ignore
 
@@ -11,11 +14,17 @@ class MemoryManager:
 
     Responsibilities:
     - Add memories for a given user.
-    - Fetch memories for a given user.
+    - Fetch memories for a given user (cached per user for `cache_ttl`
+      seconds).
     - Return a simple, uniform structure that can be visualized.
     """
 
-    def __init__(self, api_key: Optional[str] = None, **mem0_kwargs: Any) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_ttl: float = 5.0,
+        **mem0_kwargs: Any,
+    ) -> None:
         """
         Initialize the underlying mem0 hosted client.
 
@@ -27,12 +36,23 @@ class MemoryManager:
         Any additional keyword arguments are forwarded directly to
         `mem0.MemoryClient(...)` so you can configure project settings,
         base URLs, etc. according to mem0's documentation.
+
+        `cache_ttl` is how long `get_memories` results are reused
+        (seconds), i.e. the most a write from another process can go
+        unseen; pass 0 to always fetch.
         """
         if api_key is not None:
             self._client = MemoryClient(api_key=api_key, **mem0_kwargs)
         else:
             self._client = MemoryClient(**mem0_kwargs)
 
+        self._cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+        # user_id -> (fetched_at, memories)
+        self._memories_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        # user_id -> fetch in progress, shared by concurrent cache misses
+        self._inflight: Dict[str, Future] = {}
+
     # Core operations -----------------------------------------------------
     def add_memory(
         self,
@@ -90,12 +110,59 @@ class MemoryManager:
         # Add memory using the appropriate format
         if messages:
             # Messages always use AI extraction
-            return self._client.add(messages, user_id=user_id, metadata=metadata)
+            result = self._client.add(messages, user_id=user_id, metadata=metadata)
         else:
             if not text:
                 raise ValueError("text must be non-empty")
             # Use infer=False to store verbatim without AI extraction
-            return self._client.add(text, user_id=user_id, metadata=metadata, infer=infer)
+            result = self._client.add(text, user_id=user_id, metadata=metadata, infer=infer)
+
+        self.invalidate(user_id)
+        return result
+
+    def batch_add_memories(
+        self,
+        user_id: str,
+        items: List[Dict[str, Any]],
+        infer: bool = True,
+        max_workers: int = 16,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Add many text memories for the given user in one call.
+
+        mem0's hosted API has no batch-add endpoint, so the individual
+        `add` requests are issued concurrently on a thread pool. Each call
+        is network-bound, so wall-clock time drops from N round-trips to
+        roughly N / max_workers.
+
+        Args:
+            user_id: The user identifier
+            items: Dicts with a "text" key and an optional "metadata" key
+            infer: Forwarded to `add_memory` for every item
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            One entry per item, in input order: the raw mem0 response, or
+            the exception raised while adding that item.
+        """
+        if not user_id:
+            raise ValueError("user_id must be non-empty")
+        if not items:
+            return []
+
+        def _add(item: Dict[str, Any]) -> Union[Dict[str, Any], Exception]:
+            try:
+                return self.add_memory(
+                    user_id=user_id,
+                    text=item.get("text"),
+                    metadata=item.get("metadata"),
+                    infer=infer,
+                )
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as ex:
+            return list(ex.map(_add, items))
 
     def get_memories(self, user_id: str) -> List[Dict[str, Any]]:
         """
@@ -103,10 +170,60 @@ class MemoryManager:
 
         The exact structure depends on mem0's backend, but we normalize
         to a list of dicts where possible.
+
+        Results are cached per user for `cache_ttl` seconds. Concurrent
+        misses for the same user share a single mem0 request. The returned
+        list is shared, treat it as read-only.
         """
         if not user_id:
             raise ValueError("user_id must be non-empty")
 
+        if self._cache_ttl <= 0:
+            return self._fetch_memories(user_id)
+
+        with self._cache_lock:
+            entry = self._memories_cache.get(user_id)
+            if entry is not None and time.monotonic() - entry[0] < self._cache_ttl:
+                return entry[1]
+            fut = self._inflight.get(user_id)
+            owner = fut is None
+            if owner:
+                fut = self._inflight[user_id] = Future()
+        if not owner:
+            return fut.result()
+
+        try:
+            memories = self._fetch_memories(user_id)
+        except BaseException as exc:
+            with self._cache_lock:
+                if self._inflight.get(user_id) is fut:
+                    del self._inflight[user_id]
+            fut.set_exception(exc)
+            raise
+        with self._cache_lock:
+            # invalidate() detaches the future, so a fetch that raced a
+            # write is handed to its waiters but never cached
+            if self._inflight.get(user_id) is fut:
+                del self._inflight[user_id]
+                self._memories_cache[user_id] = (time.monotonic(), memories)
+        fut.set_result(memories)
+        return memories
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """
+        Drop cached memories for `user_id` (or for every user if None).
+        """
+        with self._cache_lock:
+            if user_id is None:
+                self._memories_cache.clear()
+                self._inflight.clear()
+            else:
+                self._memories_cache.pop(user_id, None)
+                self._inflight.pop(user_id, None)
+
+    # Helpers -------------------------------------------------------------
+    def _fetch_memories(self, user_id: str) -> List[Dict[str, Any]]:
+        """Uncached fetch of every memory for `user_id` from mem0."""
         # mem0 hosted client: get all memories for this user_id.
         # In mem0 v1.0+, get_all() returns a dict with "results" key
         result = self._client.get_all(filters={"AND": [{"user_id": user_id}]})
@@ -122,7 +239,6 @@ class MemoryManager:
         # Fallback: single object or dict
         return [self._coerce_record(result)]
 
-    # Helpers -------------------------------------------------------------
     @staticmethod
     def _coerce_record(record: Any) -> Dict[str, Any]:
         """
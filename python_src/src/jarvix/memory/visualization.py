@@ -1,13 +1,83 @@
 from __future__ import annotations
 
+import html
+import io
 from datetime import datetime
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Tuple
+
+
+# Static parts of the memories_to_html page (basic, dependency-free styling)
+_HTML_HEAD = """<!doctype html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8" />
+    <title>"""
+
+_HTML_STYLE = """</title>
+    <style>
+      body {
+        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+        margin: 2rem;
+        background: #0b1020;
+        color: #f5f5f5;
+      }
+      h1 {
+        margin-bottom: 1rem;
+      }
+      table {
+        border-collapse: collapse;
+        width: 100%;
+      }
+      th, td {
+        border: 1px solid #333;
+        padding: 0.5rem 0.75rem;
+        vertical-align: top;
+      }
+      th {
+        background: #151b2e;
+      }
+      tr:nth-child(even) td {
+        background: #111727;
+      }
+      tr:nth-child(odd) td {
+        background: #0d1322;
+      }
+      code {
+        font-family: Menlo, Monaco, Consolas, "Courier New", monospace;
+      }
+    </style>
+  </head>
+  <body>
+    <h1>"""
+
+_HTML_TABLE_OPEN = """</h1>
+    <table>
+      <thead>
+        <tr>
+          <th>id</th>
+          <th>timestamp</th>
+          <th>text</th>
+        </tr>
+      </thead>
+      <tbody>
+        """
+
+_HTML_TAIL = """
+      </tbody>
+    </table>
+  </body>
+</html>
+"""
 
 
 def _extract_timestamp(record: Dict[str, Any]) -> str:
     """
     Best-effort timestamp extraction as ISO string.
     """
+    # Fast path: mem0 records carry an ISO `created_at`
+    value = record.get("created_at")
+    if isinstance(value, str):
+        return value
     for key in ("created_at", "timestamp", "time", "ts"):
         value = record.get(key)
         if isinstance(value, str):
@@ -39,37 +109,41 @@ def _extract_id(record: Dict[str, Any]) -> str:
     return ""
 
 
+def _columns(memories: Iterable[Dict[str, Any]]) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Extract (ids, timestamps, texts) as parallel column lists.
+    """
+    ids: List[str] = []
+    tss: List[str] = []
+    texts: List[str] = []
+    for rec in memories:
+        ids.append(_extract_id(rec))
+        tss.append(_extract_timestamp(rec))
+        texts.append(_extract_text(rec))
+    return ids, tss, texts
+
+
 def memories_to_table(memories: Iterable[Dict[str, Any]]) -> str:
     """
     Render memories to a simple, monospaced text table.
 
     Useful for quick visualization in the terminal / logs.
     """
-    rows: List[Dict[str, str]] = []
-    for rec in memories:
-        rows.append(
-            {
-                "id": _extract_id(rec),
-                "timestamp": _extract_timestamp(rec),
-                "text": _extract_text(rec),
-            }
-        )
-
-    if not rows:
+    ids, tss, texts = _columns(memories)
+
+    if not ids:
         return "(no memories)"
 
     # Compute column widths
-    id_width = max(len("id"), max(len(r["id"]) for r in rows))
-    ts_width = max(len("timestamp"), max(len(r["timestamp"]) for r in rows))
+    id_width = max(len("id"), max(map(len, ids)))
+    ts_width = max(len("timestamp"), max(map(len, tss)))
 
     header = f"{'id'.ljust(id_width)}  {'timestamp'.ljust(ts_width)}  text"
     sep = "-" * len(header)
     lines = [header, sep]
-
-    for r in rows:
-        lines.append(
-            f"{r['id'].ljust(id_width)}  {r['timestamp'].ljust(ts_width)}  {r['text']}"
-        )
+    lines.extend(
+        f"{i.ljust(id_width)}  {t.ljust(ts_width)}  {x}" for i, t, x in zip(ids, tss, texts)
+    )
 
     return "\n".join(lines)
 
@@ -81,76 +155,25 @@ def memories_to_html(memories: Iterable[Dict[str, Any]], title: str = "User Memo
     You can write this string to a file and open it in a browser to
     visualize the memories.
     """
-    rows: List[Dict[str, str]] = []
-    for rec in memories:
-        rows.append(
-            {
-                "id": _extract_id(rec),
-                "timestamp": _extract_timestamp(rec),
-                "text": _extract_text(rec),
-            }
-        )
-
-    # Basic, dependency-free styling
-    table_rows = "\n".join(
-        f"<tr><td>{r['id']}</td><td>{r['timestamp']}</td><td>{r['text']}</td></tr>"
-        for r in rows
+    ids, tss, texts = _columns(memories)
+
+    # Write rows straight into one buffer; escape fields so memory text
+    # containing <, > or & cannot break the markup
+    buf = io.StringIO()
+    write = buf.write
+    escape = html.escape
+    for i, t, x in zip(ids, tss, texts):
+        write("<tr><td>")
+        write(escape(i))
+        write("</td><td>")
+        write(escape(t))
+        write("</td><td>")
+        write(escape(x))
+        write("</td></tr>\n")
+    table_rows = buf.getvalue().rstrip("\n")
+    title = escape(title)
+
+    return "".join(
+        (_HTML_HEAD, title, _HTML_STYLE, title, _HTML_TABLE_OPEN, table_rows, _HTML_TAIL)
     )
 
-    html = f"""<!doctype html>
-<html lang="en">
-  <head>
-    <meta charset="utf-8" />
-    <title>{title}</title>
-    <style>
-      body {{
-        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-        margin: 2rem;
-        background: #0b1020;
-        color: #f5f5f5;
-      }}
-      h1 {{
-        margin-bottom: 1rem;
-      }}
-      table {{
-        border-collapse: collapse;
-        width: 100%;
-      }}
-      th, td {{
-        border: 1px solid #333;
-        padding: 0.5rem 0.75rem;
-        vertical-align: top;
-      }}
-      th {{
-        background: #151b2e;
-      }}
-      tr:nth-child(even) td {{
-        background: #111727;
-      }}
-      tr:nth-child(odd) td {{
-        background: #0d1322;
-      }}
-      code {{
-        font-family: Menlo, Monaco, Consolas, "Courier New", monospace;
-      }}
-    </style>
-  </head>
-  <body>
-    <h1>{title}</h1>
-    <table>
-      <thead>
-        <tr>
-          <th>id</th>
-          <th>timestamp</th>
-          <th>text</th>
-        </tr>
-      </thead>
-      <tbody>
-        {table_rows}
-      </tbody>
-    </table>
-  </body>
-</html>
-"""
-    return html
-
@@ -0,0 +1,60 @@
+import sys
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from xai_sdk.chat import assistant, system, tool_result, user  # noqa: E402
+
+from jarvix.agent.core import ProactiveAgent  # noqa: E402
+
+
+def _turn(i: int, tool_calls: int = 0) -> list:
+    """One ask() worth of messages: context note, user, tool rounds, reply."""
+    msgs = [system(f"[Context] turn {i}"), user(f"question {i}")]
+    for j in range(tool_calls):
+        msgs.append(assistant(f"tool call {i}.{j}"))
+        msgs.append(tool_result(f"tool result {i}.{j}"))
+    msgs.append(assistant(f"answer {i}"))
+    return msgs
+
+
+class TrimHistoryTest(unittest.TestCase):
+    def _agent(self, max_history: int) -> ProactiveAgent:
+        agent = ProactiveAgent.__new__(ProactiveAgent)
+        agent.max_history = max_history
+        agent.chat = SimpleNamespace(messages=[system("system prompt")])
+        return agent
+
+    def _run(self, max_history: int, turns: list) -> None:
+        agent = self._agent(max_history)
+        prompt = agent.chat.messages[0]
+        for n, turn in enumerate(turns, 1):
+            agent.chat.messages.extend(turn)
+            agent._trim_history()
+            messages = agent.chat.messages
+
+            self.assertIs(messages[0], prompt)
+            self.assertLessEqual(len(messages), max_history)
+            # Only whole turns are dropped, so tool calls keep their results
+            kept = messages[1:]
+            suffixes = [sum(turns[k:n], []) for k in range(n)]
+            self.assertIn(kept, suffixes)
+
+    def test_history_stays_within_limit(self):
+        self._run(10, [_turn(i) for i in range(20)])
+
+    def test_tool_calls_stay_paired_with_results(self):
+        self._run(12, [_turn(i, tool_calls=i % 3) for i in range(20)])
+
+    def test_short_history_is_untouched(self):
+        agent = self._agent(40)
+        agent.chat.messages.extend(_turn(0, tool_calls=2))
+        before = list(agent.chat.messages)
+        agent._trim_history()
+        self.assertEqual(agent.chat.messages, before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from jarvix.ingest import pipeline  # noqa: E402
+from jarvix.ingest.pipeline import IngestConfig, ingest_file, ingest_paths  # noqa: E402
+
+
+class _FakeMemoryManager:
+    def __init__(self):
+        self.added = []
+        self._lock = threading.Lock()
+
+    def get_memories(self, user_id):
+        return []
+
+    def add_memory(self, user_id, text, metadata=None, infer=True):
+        with self._lock:
+            self.added.append(text)
+
+
+def _write_calendar(dirpath: Path, name: str, n: int) -> Path:
+    event = {
+        "summary": "Weekly 1:1",
+        "start": {"dateTime": "2024-12-08T17:00:00-08:00"},
+        "end": {"dateTime": "2024-12-08T17:30:00-08:00"},
+    }
+    path = dirpath / name
+    path.write_text(json.dumps({"events": [dict(event, event_id=f"ev-{i}") for i in range(n)]}))
+    return path
+
+
+class EnrichSingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _fake_enrich(self, client, model, record, context_note, prior_mems=None):
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)  # keep the call in flight while other workers arrive
+        return "Weekly 1:1 on 2024-12-09."
+
+    def test_repeated_records_in_one_batch_call_grok_once(self):
+        path = _write_calendar(self.dir, "cal.json", 16)
+        mem = _FakeMemoryManager()
+        with mock.patch.object(pipeline, "grok_enrich", self._fake_enrich):
+            processed, stored = ingest_file("calendar", path, mem, IngestConfig(workers=8), client=object())
+
+        self.assertEqual((processed, stored), (16, 16))
+        self.assertEqual(self.calls, 1)
+
+    def test_repeated_records_across_concurrent_files_call_grok_once(self):
+        paths = [_write_calendar(self.dir, f"cal{i}.json", 8) for i in range(4)]
+        mem = _FakeMemoryManager()
+        with mock.patch.object(pipeline, "grok_enrich", self._fake_enrich), \
+                mock.patch.object(pipeline, "Client", lambda timeout: object()):
+            processed, stored = ingest_paths("calendar", paths, mem, IngestConfig(workers=8))
+
+        self.assertEqual((processed, stored), (32, 32))
+        self.assertEqual(self.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
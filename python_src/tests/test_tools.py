@@ -0,0 +1,77 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from jarvix.agent.tools import MemoryTools  # noqa: E402
+
+_SAMPLE = [
+    "Prefers window seats on flights",
+    "Usually orders oat milk latte at Blue Bottle",
+    "Has a weekly 1:1 with Sungwon on Mondays",
+    "Allergic to peanuts",
+    "Lives in San Francisco near the Mission",
+    "Daughter Emma plays soccer on Saturdays",
+    "Works as a software engineer at xAI",
+    "Goes to the gym at 6am on weekdays",
+]
+
+
+class _FakeMemoryManager:
+    def __init__(self, texts):
+        self.memories = [{"id": str(i), "memory": t} for i, t in enumerate(texts)]
+
+    def get_memories(self, user_id):
+        return self.memories
+
+
+def _hits(result: str) -> list:
+    return [line.split(". ", 1)[1] for line in result.splitlines() if ". " in line]
+
+
+class SearchMemoriesTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = _FakeMemoryManager(_SAMPLE)
+        self.tools = MemoryTools("demo_user", self.manager)
+
+    def test_plural_and_singular_forms_match(self):
+        self.assertEqual(_hits(self.tools.search_memories("flight seat")), ["Prefers window seats on flights"])
+        self.assertEqual(
+            _hits(self.tools.search_memories("lattes")),
+            ["Usually orders oat milk latte at Blue Bottle"],
+        )
+
+    def test_related_words_match(self):
+        self.assertEqual(_hits(self.tools.search_memories("peanut allergy")), ["Allergic to peanuts"])
+
+    def test_nonsense_query_returns_nothing(self):
+        for query in ("quantum physics", "dentist appointment", "zzqx"):
+            self.assertEqual(self.tools.search_memories(query), f"No memories matching '{query}'")
+
+    def test_exact_substring_hits_come_first(self):
+        self.manager.memories = [
+            {"id": "1", "memory": "Orders vary, but usually an order of fries"},
+            {
+                "id": "2",
+                "memory": "Their usual order at Blue Bottle on weekday mornings before "
+                "the commute is a hot cortado with oat milk",
+            },
+        ]
+        # TF-IDF alone ranks the short fries memory higher
+        index = self.tools._build_index(self.manager.memories)
+        ranked = self.tools._rank_memories("usual order", self.manager.memories, index)
+        self.assertEqual(ranked[0][1]["id"], "1")
+
+        hits = _hits(self.tools.search_memories("usual order"))
+        self.assertTrue(hits[0].startswith("Their usual order"))
+
+    def test_index_follows_in_place_text_updates(self):
+        self.assertEqual(_hits(self.tools.search_memories("latte")), [_SAMPLE[1]])
+        self.manager.memories[1] = {"id": "1", "memory": "Usually orders matcha at Blue Bottle"}
+        self.assertEqual(self.tools.search_memories("latte"), "No memories matching 'latte'")
+        self.assertEqual(_hits(self.tools.search_memories("matcha")), ["Usually orders matcha at Blue Bottle"])
+
+
+if __name__ == "__main__":
+    unittest.main()